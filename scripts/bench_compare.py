@@ -11,10 +11,24 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import mmap
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise SystemExit("numpy is required. Install: py -3 -m pip install numpy") from exc
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from matplotlib.figure import Figure
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -22,16 +36,27 @@ DEFAULT_BASELINE = REPO_ROOT / "bench" / "results" / "baseline" / "result.json"
 DEFAULT_CURRENT = REPO_ROOT / "bench" / "results" / "current" / "result.json"
 DEFAULT_OUTDIR = REPO_ROOT / "build" / "bench" / "compare"
 
+_CONTEXT_HEAD_RE = re.compile(r'\s*\{\s*"context"\s*:\s*')
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
 
 @dataclass
-class BenchRow:
-    name: str
-    baseline_mean_ns: float
-    current_mean_ns: float
-    delta_pct: float
-    speedup: float
-    baseline_cv_pct: Optional[float]
-    current_cv_pct: Optional[float]
+class BenchTable:
+    """Column-oriented compare results; missing CV values are NaN."""
+
+    names: List[str]
+    baseline_mean_ns: np.ndarray
+    current_mean_ns: np.ndarray
+    delta_pct: np.ndarray
+    speedup: np.ndarray
+    baseline_cv_pct: np.ndarray
+    current_cv_pct: np.ndarray
+    # Rows the regression gates apply to (--gate-include); matched once here
+    # and reused by every gate instead of re-running the regex per check.
+    gate_mask: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 @dataclass
@@ -43,8 +68,43 @@ class ContextInfo:
 
 
 def _load_json(path: Path) -> dict:
+    # json.loads accepts bytes, which skips the text-mode decode into an
+    # intermediate str. orjson goes further and parses straight out of a
+    # read-only mapping, so the file contents are never copied onto the heap.
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and filesystems without mmap support.
+            return orjson.loads(f.read())
+    with mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+
+def _load_context_only(path: Path, chunk_size: int = 1 << 16) -> dict:
+    # Google Benchmark writes "context" as the first top-level key, so the
+    # object can be decoded from the head of the file without touching the
+    # (much larger) "benchmarks" array. Other layouts fall back to a full parse.
+    decoder = json.JSONDecoder()
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        buf = f.read(chunk_size)
+        m = _CONTEXT_HEAD_RE.match(buf)
+        while m is not None:
+            try:
+                ctx, _ = decoder.raw_decode(buf, m.end())
+            except json.JSONDecodeError:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                buf += chunk
+                continue
+            if isinstance(ctx, dict):
+                return ctx
+            break
+    return _load_json(path).get("context", {})
 
 
 def _extract_context(payload: dict) -> ContextInfo:
@@ -57,87 +117,129 @@ def _extract_context(payload: dict) -> ContextInfo:
     )
 
 
-def _extract_aggregates(payload: dict) -> Dict[str, Dict[str, float]]:
-    out: Dict[str, Dict[str, float]] = {}
+def _extract_aggregates(
+    payload: dict,
+    include_pat: Optional[re.Pattern[str]],
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    # Only the mean and cv aggregates feed the report, so everything else is
+    # dropped while scanning instead of being collected per run. Runs rejected
+    # by --include are dropped here too, before they cost an insert.
+    means: Dict[str, float] = {}
+    cvs: Dict[str, float] = {}
     for entry in payload.get("benchmarks", []):
-        run_name = entry.get("run_name")
         agg = entry.get("aggregate_name")
-        if not run_name or not agg:
+        if agg == "mean":
+            slot = means
+        elif agg == "cv":
+            slot = cvs
+        else:
             continue
 
-        slot = out.setdefault(str(run_name), {})
+        run_name = entry.get("run_name")
         cpu_time = entry.get("cpu_time")
-        if cpu_time is not None:
-            slot[str(agg)] = float(cpu_time)
-    return out
-
-
-def _to_rows(
-    baseline: Dict[str, Dict[str, float]],
-    current: Dict[str, Dict[str, float]],
-    include_regex: Optional[str],
-) -> List[BenchRow]:
-    names = sorted(set(baseline) & set(current))
-    if include_regex:
-        pat = re.compile(include_regex)
-        names = [n for n in names if pat.search(n)]
-
-    rows: List[BenchRow] = []
-    for name in names:
-        b_mean = baseline[name].get("mean")
-        c_mean = current[name].get("mean")
-        if b_mean is None or c_mean is None:
+        if not run_name or cpu_time is None:
             continue
 
-        delta_pct = ((c_mean - b_mean) / b_mean * 100.0) if b_mean != 0 else math.nan
-        speedup = (b_mean / c_mean) if c_mean != 0 else math.nan
-
-        b_cv = baseline[name].get("cv")
-        c_cv = current[name].get("cv")
-
-        rows.append(
-            BenchRow(
-                name=name,
-                baseline_mean_ns=b_mean,
-                current_mean_ns=c_mean,
-                delta_pct=delta_pct,
-                speedup=speedup,
-                baseline_cv_pct=(b_cv * 100.0 if b_cv is not None else None),
-                current_cv_pct=(c_cv * 100.0 if c_cv is not None else None),
-            )
-        )
-    return rows
-
+        run_name = str(run_name)
+        if include_pat and not include_pat.search(run_name):
+            continue
+        slot[run_name] = float(cpu_time)
+    return means, cvs
+
+
+def _build_table(
+    baseline_payload: dict,
+    current_payload: dict,
+    include_pat: Optional[re.Pattern[str]],
+    gate_pat: Optional[re.Pattern[str]],
+) -> BenchTable:
+    b_means, b_cvs = _extract_aggregates(baseline_payload, include_pat)
+    c_means, c_cvs = _extract_aggregates(current_payload, include_pat)
+
+    names = sorted(b_means.keys() & c_means.keys())
+    count = len(names)
+    b = np.fromiter((b_means[n] for n in names), dtype=np.float64, count=count)
+    c = np.fromiter((c_means[n] for n in names), dtype=np.float64, count=count)
+    b_cv = np.fromiter((b_cvs.get(n, math.nan) for n in names), dtype=np.float64, count=count)
+    c_cv = np.fromiter((c_cvs.get(n, math.nan) for n in names), dtype=np.float64, count=count)
+    if gate_pat is None:
+        gate_mask = np.ones(count, dtype=bool)
+    else:
+        gate_mask = np.fromiter((gate_pat.search(n) is not None for n in names), dtype=bool, count=count)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = np.where(b != 0, (c - b) / b * 100.0, np.nan)
+        speedup = np.where(c != 0, b / c, np.nan)
+
+    return BenchTable(
+        names=names,
+        baseline_mean_ns=b,
+        current_mean_ns=c,
+        delta_pct=delta,
+        speedup=speedup,
+        baseline_cv_pct=b_cv * 100.0,
+        current_cv_pct=c_cv * 100.0,
+        gate_mask=gate_mask,
+    )
 
-def _is_finite(x: float) -> bool:
-    return not math.isnan(x) and not math.isinf(x)
 
+def _find_regressions(table: BenchTable, max_regress_pct: float) -> np.ndarray:
+    delta = table.delta_pct
+    return np.flatnonzero(table.gate_mask & np.isfinite(delta) & (delta > max_regress_pct))
 
-def _find_regressions(rows: List[BenchRow], max_regress_pct: float) -> List[BenchRow]:
-    return [r for r in rows if _is_finite(r.delta_pct) and r.delta_pct > max_regress_pct]
 
+def _gate_failures(
+    table: BenchTable,
+    max_regress_pct: Optional[float],
+    max_mean_regress_pct: Optional[float],
+) -> List[str]:
+    lines: List[str] = []
+    if max_regress_pct is not None:
+        regressions = _find_regressions(table, max_regress_pct)
+        if regressions.size:
+            lines.append(
+                f"[bench-gate] FAIL: {len(regressions)} benchmark(s) exceed "
+                f"+{max_regress_pct:.2f}% regression threshold."
+            )
+            lines += [f"  - {table.names[i]}: {table.delta_pct[i]:+.2f}%" for i in regressions.tolist()]
+
+    if max_mean_regress_pct is not None:
+        finite = table.delta_pct[table.gate_mask & np.isfinite(table.delta_pct)]
+        if finite.size:
+            mean_delta = float(finite.mean())
+            if mean_delta > max_mean_regress_pct:
+                lines.append(
+                    "[bench-gate] FAIL: mean delta "
+                    f"{mean_delta:+.2f}% exceeds +{max_mean_regress_pct:.2f}%."
+                )
+    return lines
 
-def _display_name(name: str, max_len: int) -> Tuple[str, bool]:
-    cleaned = name[3:] if name.startswith("BM_") else name
-    cleaned = cleaned.replace("_", " ")
-    if len(cleaned) <= max_len:
-        return cleaned, False
-    return cleaned[: max_len - 3] + "...", True
 
+def _display_names(names: List[str], max_len: int) -> Tuple[List[str], List[Tuple[str, str]]]:
+    removeprefix = str.removeprefix
+    translate = str.translate
+    cleaned = [translate(removeprefix(name, "BM_"), _UNDERSCORE_TO_SPACE) for name in names]
 
-def _display_names(rows: List[BenchRow], max_len: int) -> Tuple[List[str], List[Tuple[str, str]]]:
     display: List[str] = []
     truncated: List[Tuple[str, str]] = []
-    for r in rows:
-        short, is_trunc = _display_name(r.name, max_len)
+    for name, short in zip(names, cleaned):
+        if len(short) > max_len:
+            short = short[: max_len - 3] + "..."
+            truncated.append((short, name))
         display.append(short)
-        if is_trunc:
-            truncated.append((short, r.name))
     return display, truncated
 
 
+def _fmt_cv(value: float, suffix: str = "") -> str:
+    return "-" if math.isnan(value) else f"{value:.2f}{suffix}"
+
+
+def _cv_column(values: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(values), "-", np.char.mod("%.2f", values))
+
+
 def _save_markdown(
-    rows: List[BenchRow],
+    table: BenchTable,
     out_md: Path,
     baseline_label: str,
     current_label: str,
@@ -146,7 +248,7 @@ def _save_markdown(
     baseline_ctx: ContextInfo,
     current_ctx: ContextInfo,
 ) -> None:
-    lines = [
+    header = [
         "# Benchmark Comparison Report",
         "",
         f"- Baseline label: `{baseline_label}`",
@@ -167,51 +269,189 @@ def _save_markdown(
         "|---|---:|---:|---:|---:|---:|---:|",
     ]
 
-    for r in rows:
-        bcv = f"{r.baseline_cv_pct:.2f}" if r.baseline_cv_pct is not None else "-"
-        ccv = f"{r.current_cv_pct:.2f}" if r.current_cv_pct is not None else "-"
-        lines.append(
-            f"| {r.name} | {r.baseline_mean_ns:.3f} | {r.current_mean_ns:.3f} | "
-            f"{r.delta_pct:+.2f}% | {r.speedup:.3f} | {bcv} | {ccv} |"
-        )
+    # Numeric columns are formatted in one C pass each; the row loop below
+    # only joins ready-made strings while streaming through a large buffer.
+    columns = (
+        np.char.mod("%.3f", table.baseline_mean_ns),
+        np.char.mod("%.3f", table.current_mean_ns),
+        np.char.mod("%+.2f%%", table.delta_pct),
+        np.char.mod("%.3f", table.speedup),
+        _cv_column(table.baseline_cv_pct),
+        _cv_column(table.current_cv_pct),
+    )
+    rows = zip(table.names, *(col.tolist() for col in columns))
+
+    with out_md.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("\n".join(header) + "\n")
+        f.writelines(f"| {' | '.join(row)} |\n" for row in rows)
+
+
+_BASELINE_COLOR = "#64748b"
+_CURRENT_COLOR = "#0ea5e9"
+_BETTER_COLOR = "#16a34a"
+_WORSE_COLOR = "#dc2626"
 
-    out_md.write_text("\n".join(lines) + "\n", encoding="utf-8")
+# Vector charts with at least this many benchmarks embed the suite bars as one
+# bitmap; below it every bar stays a crisp path.
+_RASTERIZE_MIN_BENCHMARKS = 150
 
 
 def _plot(
-    rows: List[BenchRow],
-    out_png: Path,
+    table: BenchTable,
+    out_chart: Path,
     baseline_label: str,
     current_label: str,
     baseline_ctx: ContextInfo,
     current_ctx: ContextInfo,
     name_max_len: int,
+    dpi: int,
 ) -> None:
     try:
+        import matplotlib
+
+        # Select the non-interactive backend before pyplot is imported so no
+        # GUI toolkit is probed; charts are only ever written to disk.
+        matplotlib.use("Agg", force=True)
         import matplotlib.pyplot as plt
-        from matplotlib import patheffects
     except Exception as exc:  # pragma: no cover
         raise SystemExit("matplotlib is required. Install: py -3 -m pip install matplotlib") from exc
 
     plt.style.use("seaborn-v0_8-whitegrid")
 
-    names = [r.name for r in rows]
-    display_names, trunc_map = _display_names(rows, name_max_len)
+    display_names, trunc_map = _display_names(table.names, name_max_len)
+
+    # A single benchmark is the common CI case; it gets a one-axis layout
+    # instead of the two-panel grid built for suites.
+    if len(table) == 1:
+        fig = _plot_single(table, display_names[0], baseline_label, current_label, dpi)
+    else:
+        rasterize_bars = out_chart.suffix.lower() != ".png" and len(table) >= _RASTERIZE_MIN_BENCHMARKS
+        fig = _plot_suite(table, display_names, baseline_label, current_label, dpi, rasterize_bars)
+
+    avg_delta = float(table.delta_pct.mean())
+    mean_speedup = float(np.nansum(table.speedup)) / len(table)
+
+    subtitle = (
+        f"Baseline: {baseline_label}   Current: {current_label}   "
+        f"Avg delta: {avg_delta:+.2f}%   Mean speedup: {mean_speedup:.2f}x"
+    )
+
+    fig.suptitle(
+        "Patternia Benchmark Comparison",
+        fontsize=21,
+        fontweight="bold",
+        color="#0f172a",
+        y=0.985,
+    )
+    fig.text(0.5, 0.948, subtitle, ha="center", va="top", fontsize=10, color="#334155")
+
+    ctx_line = (
+        f"Baseline date: {baseline_ctx.date} | Current date: {current_ctx.date} | "
+        f"Host: {current_ctx.host_name or baseline_ctx.host_name}"
+    )
+    fig.text(0.5, 0.02, ctx_line, ha="center", va="bottom", fontsize=9, color="#475569")
+
+    if trunc_map:
+        pairs = [f"{short} => {full}" for short, full in trunc_map]
+        fig.text(0.5, 0.045, "; ".join(pairs), ha="center", va="bottom", fontsize=8.5, color="#64748b")
+
+    # The format follows the file suffix; dpi only matters for raster output.
+    fig.savefig(out_chart, dpi=dpi)
+    plt.close(fig)
+
+
+def _plot_single(
+    table: BenchTable,
+    display_name: str,
+    baseline_label: str,
+    current_label: str,
+    dpi: int,
+) -> Figure:
+    # _plot has already selected the Agg backend.
+    import matplotlib.pyplot as plt
+
+    delta = float(table.delta_pct[0])
+    bval = float(table.baseline_mean_ns[0])
+    cval = float(table.current_mean_ns[0])
+
+    fig, ax = plt.subplots(figsize=(12.0, 7.4), dpi=dpi)
+    fig.patch.set_facecolor("#f8fafc")
+    fig.subplots_adjust(left=0.08, right=0.58, bottom=0.13, top=0.80)
+    ax.set_facecolor("#ffffff")
+
+    bars = ax.bar(
+        [0, 1],
+        [bval, cval],
+        width=0.55,
+        color=[_BASELINE_COLOR, _CURRENT_COLOR],
+        edgecolor=["#334155", "#0c4a6e"],
+        linewidth=0.4,
+    )
+    ax.bar_label(bars, fmt="%.2f", padding=3, fontsize=10, color="#0f172a")
+    ax.set_xticks([0, 1])
+    ax.set_xticklabels([baseline_label, current_label], fontsize=11)
+    ax.set_ylabel("ns", fontsize=11)
+    ax.set_title(
+        f"{display_name}: CPU Mean Time (lower is better)",
+        fontsize=13,
+        fontweight="bold",
+        color="#0f172a",
+        pad=10,
+    )
+    ymax = max(bval, cval)
+    ax.set_ylim(0.0, ymax * 1.25 if ymax > 0 else 1.0)
+
+    box_style = dict(boxstyle="round,pad=0.55", facecolor="#ffffff", edgecolor="#cbd5e1", linewidth=1.1)
+    delta_color = _BETTER_COLOR if delta < 0 else _WORSE_COLOR
+
+    fig.text(0.66, 0.72, "Delta vs Baseline", fontsize=11, color="#334155")
+    fig.text(
+        0.66,
+        0.60,
+        f"{delta:+.2f}%",
+        fontsize=23,
+        fontweight="bold",
+        color=delta_color,
+        bbox=box_style,
+    )
+    fig.text(0.66, 0.44, "Speedup", fontsize=11, color="#334155")
+    fig.text(
+        0.66,
+        0.32,
+        f"{float(table.speedup[0]):.2f}x",
+        fontsize=23,
+        fontweight="bold",
+        color="#0f172a",
+        bbox=box_style,
+    )
 
-    bvals = [r.baseline_mean_ns for r in rows]
-    cvals = [r.current_mean_ns for r in rows]
-    deltas = [r.delta_pct for r in rows]
+    bcv = _fmt_cv(float(table.baseline_cv_pct[0]), "%")
+    ccv = _fmt_cv(float(table.current_cv_pct[0]), "%")
+    fig.text(0.66, 0.18, f"CV baseline: {bcv}   CV current: {ccv}", fontsize=10, color="#475569")
+    return fig
 
-    baseline_color = "#64748b"
-    current_color = "#0ea5e9"
-    better_color = "#16a34a"
-    worse_color = "#dc2626"
 
-    n = max(1, len(rows))
+def _plot_suite(
+    table: BenchTable,
+    display_names: List[str],
+    baseline_label: str,
+    current_label: str,
+    dpi: int,
+    rasterize_bars: bool,
+) -> Figure:
+    # _plot has already selected the Agg backend.
+    import matplotlib.pyplot as plt
+    from matplotlib import patheffects
+
+    bvals = table.baseline_mean_ns
+    cvals = table.current_mean_ns
+    deltas = table.delta_pct
+
+    n = len(table)
     fig_w = max(12.0, 1.8 * n + 6.0)
-    fig_h = 9.0 if n > 1 else 7.8
+    fig_h = 9.0
 
-    fig = plt.figure(figsize=(fig_w, fig_h), dpi=220, constrained_layout=False)
+    fig = plt.figure(figsize=(fig_w, fig_h), dpi=dpi, constrained_layout=False)
     fig.patch.set_facecolor("#f8fafc")
     gs = fig.add_gridspec(
         2,
@@ -230,23 +470,23 @@ def _plot(
     for ax in (ax1, ax2):
         ax.set_facecolor("#ffffff")
 
-    idx = list(range(len(rows)))
+    idx = np.arange(n)
     width = 0.38
 
     bars_b = ax1.bar(
-        [i - width / 2 for i in idx],
+        idx - width / 2,
         bvals,
         width=width,
-        color=baseline_color,
+        color=_BASELINE_COLOR,
         label=baseline_label,
         edgecolor="#334155",
         linewidth=0.4,
     )
     bars_c = ax1.bar(
-        [i + width / 2 for i in idx],
+        idx + width / 2,
         cvals,
         width=width,
-        color=current_color,
+        color=_CURRENT_COLOR,
         label=current_label,
         edgecolor="#0c4a6e",
         linewidth=0.4,
@@ -261,130 +501,41 @@ def _plot(
     )
     ax1.set_ylabel("ns", fontsize=11)
     ax1.set_xticks(idx)
-
-    if n == 1:
-        ax1.set_xticklabels(display_names, rotation=0, ha="center", fontsize=11)
-    else:
-        ax1.set_xticklabels(display_names, rotation=14, ha="right", fontsize=10)
-
+    ax1.set_xticklabels(display_names, rotation=14, ha="right", fontsize=10)
     ax1.legend(frameon=False, fontsize=11)
 
-    ymax = max(max(bvals, default=0.0), max(cvals, default=0.0))
+    ymax = float(max(bvals.max(), cvals.max()))
     ax1.set_ylim(0.0, ymax * 1.25 if ymax > 0 else 1.0)
 
+    # bar_label emits one label per bar without a Python-level text loop. For
+    # very large suites only the bar patches are rasterized, so vector outputs
+    # embed them as an image instead of one path per patch while gridlines,
+    # ticks and labels stay vector; smaller charts keep every bar as a path.
     for bars in (bars_b, bars_c):
-        for bar in bars:
-            h = bar.get_height()
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2,
-                h + (ymax * 0.02 if ymax > 0 else 0.02),
-                f"{h:.2f}",
-                ha="center",
-                va="bottom",
-                fontsize=9,
-                color="#0f172a",
-            )
-
-    if n == 1:
-        row = rows[0]
-        delta_color = better_color if row.delta_pct < 0 else worse_color
-
-        ax2.axis("off")
-        ax2.set_title("Summary", fontsize=14, fontweight="bold", color="#0f172a", pad=12)
-
-        box_style = dict(boxstyle="round,pad=0.55", facecolor="#ffffff", edgecolor="#cbd5e1", linewidth=1.1)
-
-        ax2.text(0.15, 0.68, "Delta vs Baseline", fontsize=11, color="#334155", transform=ax2.transAxes)
-        ax2.text(
-            0.15,
-            0.46,
-            f"{row.delta_pct:+.2f}%",
-            fontsize=23,
-            fontweight="bold",
-            color=delta_color,
-            transform=ax2.transAxes,
-            bbox=box_style,
-        )
-
-        ax2.text(0.55, 0.68, "Speedup", fontsize=11, color="#334155", transform=ax2.transAxes)
-        ax2.text(
-            0.55,
-            0.46,
-            f"{row.speedup:.2f}x",
-            fontsize=23,
-            fontweight="bold",
-            color="#0f172a",
-            transform=ax2.transAxes,
-            bbox=box_style,
-        )
-
-        bcv = f"{row.baseline_cv_pct:.2f}%" if row.baseline_cv_pct is not None else "-"
-        ccv = f"{row.current_cv_pct:.2f}%" if row.current_cv_pct is not None else "-"
-        ax2.text(
-            0.15,
-            0.18,
-            f"CV baseline: {bcv}   CV current: {ccv}",
-            fontsize=10,
-            color="#475569",
-            transform=ax2.transAxes,
-        )
-    else:
-        colors = [better_color if d < 0 else worse_color for d in deltas]
-        bars = ax2.barh(display_names, deltas, color=colors, alpha=0.95)
-        ax2.axvline(0.0, color="#111827", linewidth=1.1)
-        ax2.set_title("Delta vs Baseline (%)  (negative is faster)", fontsize=14, fontweight="bold", color="#0f172a")
-        ax2.set_xlabel("%", fontsize=11)
-
-        max_abs = max((abs(d) for d in deltas), default=1.0)
-        lim = max(5.0, max_abs * 1.2)
-        ax2.set_xlim(-lim, lim)
-
-        for bar, delta in zip(bars, deltas):
-            x = bar.get_width()
-            y = bar.get_y() + bar.get_height() / 2
-            txt = f"{delta:+.2f}%"
-            ha = "left" if x >= 0 else "right"
-            pad = 0.4 if x >= 0 else -0.4
-            ax2.text(
-                x + pad,
-                y,
-                txt,
-                va="center",
-                ha=ha,
-                fontsize=10,
-                color="#0f172a",
-                path_effects=[patheffects.withStroke(linewidth=2.2, foreground="white")],
-            )
-
-    avg_delta = sum(deltas) / len(deltas) if deltas else 0.0
-    mean_speedup = sum((r.speedup for r in rows if not math.isnan(r.speedup))) / max(1, len(rows))
-
-    subtitle = (
-        f"Baseline: {baseline_label}   Current: {current_label}   "
-        f"Avg delta: {avg_delta:+.2f}%   Mean speedup: {mean_speedup:.2f}x"
-    )
-
-    fig.suptitle(
-        "Patternia Benchmark Comparison",
-        fontsize=21,
-        fontweight="bold",
+        ax1.bar_label(bars, fmt="%.2f", padding=3, fontsize=9, color="#0f172a")
+        if rasterize_bars:
+            for patch in bars:
+                patch.set_rasterized(True)
+
+    colors = np.where(deltas < 0, _BETTER_COLOR, _WORSE_COLOR)
+    bars = ax2.barh(display_names, deltas, color=colors, alpha=0.95)
+    ax2.axvline(0.0, color="#111827", linewidth=1.1)
+    ax2.set_title("Delta vs Baseline (%)  (negative is faster)", fontsize=14, fontweight="bold", color="#0f172a")
+    ax2.set_xlabel("%", fontsize=11)
+
+    max_abs = float(np.nanmax(np.abs(deltas), initial=1.0))
+    lim = max(5.0, max_abs * 1.2)
+    ax2.set_xlim(-lim, lim)
+
+    ax2.bar_label(
+        bars,
+        fmt="%+.2f%%",
+        padding=4,
+        fontsize=10,
         color="#0f172a",
-        y=0.985,
+        path_effects=[patheffects.withStroke(linewidth=2.2, foreground="white")],
     )
-    fig.text(0.5, 0.948, subtitle, ha="center", va="top", fontsize=10, color="#334155")
-
-    ctx_line = (
-        f"Baseline date: {baseline_ctx.date} | Current date: {current_ctx.date} | "
-        f"Host: {current_ctx.host_name or baseline_ctx.host_name}"
-    )
-    fig.text(0.5, 0.02, ctx_line, ha="center", va="bottom", fontsize=9, color="#475569")
-
-    if trunc_map:
-        pairs = [f"{short} => {full}" for short, full in trunc_map]
-        fig.text(0.5, 0.045, "; ".join(pairs), ha="center", va="bottom", fontsize=8.5, color="#64748b")
-
-    fig.savefig(out_png, dpi=220)
-    plt.close(fig)
+    return fig
 
 
 def main() -> int:
@@ -409,8 +560,46 @@ def main() -> int:
         default=None,
         help="Fail if mean delta %% across selected rows is greater than this threshold.",
     )
+    parser.add_argument(
+        "--gate-include",
+        default="",
+        help="Regex: only apply the regression gates to matching benchmarks (all are still reported)",
+    )
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="When a regression gate fails, exit without writing the chart or markdown report.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("png", "svg", "pdf"),
+        default="svg",
+        help="Chart format (default: svg; vector output renders much faster than a high-dpi PNG)",
+    )
+    parser.add_argument("--dpi", type=int, default=220, help="Chart resolution for --format png")
+    parser.add_argument(
+        "--no-plot",
+        action="store_true",
+        help="Skip chart generation (and the matplotlib import) and only write markdown.",
+    )
+    parser.add_argument(
+        "--context-only",
+        action="store_true",
+        help="Only print the run context (date/host/build) of both files; skip the comparison.",
+    )
     args = parser.parse_args()
 
+    include_regex = args.include.strip()
+    gate_regex = args.gate_include.strip()
+    try:
+        include_pat = re.compile(include_regex) if include_regex else None
+    except re.error as exc:
+        raise SystemExit(f"invalid --include regex: {exc}") from exc
+    try:
+        gate_pat = re.compile(gate_regex) if gate_regex else None
+    except re.error as exc:
+        raise SystemExit(f"invalid --gate-include regex: {exc}") from exc
+
     baseline_path = Path(args.baseline).expanduser().resolve()
     current_path = Path(args.current).expanduser().resolve()
     outdir = Path(args.outdir).expanduser().resolve()
@@ -421,33 +610,48 @@ def main() -> int:
     if not current_path.exists():
         raise SystemExit(f"current file not found: {current_path}")
 
+    if args.context_only:
+        for label, path in ((args.label_baseline, baseline_path), (args.label_current, current_path)):
+            ctx = _extract_context({"context": _load_context_only(path)})
+            print(
+                f"{label}: date={ctx.date} host={ctx.host_name} "
+                f"build={ctx.library_build_type} executable={ctx.executable}"
+            )
+        return 0
+
     baseline_payload = _load_json(baseline_path)
     current_payload = _load_json(current_path)
 
     baseline_ctx = _extract_context(baseline_payload)
     current_ctx = _extract_context(current_payload)
 
-    baseline_agg = _extract_aggregates(baseline_payload)
-    current_agg = _extract_aggregates(current_payload)
-
-    rows = _to_rows(baseline_agg, current_agg, args.include.strip() or None)
-    if not rows:
+    table = _build_table(baseline_payload, current_payload, include_pat, gate_pat)
+    if not len(table):
         raise SystemExit("No overlapping benchmark aggregates found (check inputs / --include).")
 
-    out_png = outdir / f"{args.prefix}.png"
+    # Gates only need the delta column, so evaluate them before rendering;
+    # with --fast-fail a failing gate skips the chart and report entirely.
+    failures = _gate_failures(table, args.fail_if_regress_pct, args.fail_if_mean_regress_pct)
+    if failures and args.fast_fail:
+        print("\n".join(failures))
+        return 2
+
+    out_chart = outdir / f"{args.prefix}.{args.format}"
     out_md = outdir / f"{args.prefix}.md"
 
-    _plot(
-        rows,
-        out_png,
-        args.label_baseline,
-        args.label_current,
-        baseline_ctx,
-        current_ctx,
-        max(10, args.name_max_len),
-    )
+    if not args.no_plot:
+        _plot(
+            table,
+            out_chart,
+            args.label_baseline,
+            args.label_current,
+            baseline_ctx,
+            current_ctx,
+            max(10, args.name_max_len),
+            args.dpi,
+        )
     _save_markdown(
-        rows,
+        table,
         out_md,
         args.label_baseline,
         args.label_current,
@@ -457,38 +661,17 @@ def main() -> int:
         current_ctx,
     )
 
-    print(f"Saved chart: {out_png}")
+    if not args.no_plot:
+        print(f"Saved chart: {out_chart}")
     print(f"Saved report: {out_md}")
 
-    exit_code = 0
-    if args.fail_if_regress_pct is not None:
-        regressions = _find_regressions(rows, args.fail_if_regress_pct)
-        if regressions:
-            print(
-                f"[bench-gate] FAIL: {len(regressions)} benchmark(s) exceed "
-                f"+{args.fail_if_regress_pct:.2f}% regression threshold."
-            )
-            for r in regressions:
-                print(f"  - {r.name}: {r.delta_pct:+.2f}%")
-            exit_code = 2
-
-    if args.fail_if_mean_regress_pct is not None:
-        deltas = [r.delta_pct for r in rows if _is_finite(r.delta_pct)]
-        if deltas:
-            mean_delta = sum(deltas) / len(deltas)
-            if mean_delta > args.fail_if_mean_regress_pct:
-                print(
-                    "[bench-gate] FAIL: mean delta "
-                    f"{mean_delta:+.2f}% exceeds +{args.fail_if_mean_regress_pct:.2f}%."
-                )
-                exit_code = 2
+    if failures:
+        print("\n".join(failures))
+        return 2
 
-    if exit_code == 0 and (
-        args.fail_if_regress_pct is not None or args.fail_if_mean_regress_pct is not None
-    ):
+    if args.fail_if_regress_pct is not None or args.fail_if_mean_regress_pct is not None:
         print("[bench-gate] PASS: regression thresholds satisfied.")
-
-    return exit_code
+    return 0
 
 
 if __name__ == "__main__":
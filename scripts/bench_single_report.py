@@ -11,12 +11,29 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
+import io
 import json
 import math
 import re
+from collections import defaultdict
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -24,7 +41,7 @@ DEFAULT_INPUT = REPO_ROOT / "build" / "variant_all.json"
 DEFAULT_OUTDIR = REPO_ROOT / "build" / "bench" / "single"
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchPoint:
     base_name: str
     impl: str
@@ -51,10 +68,91 @@ class ScenarioSummary:
 
 PATTERNIA_IMPLS = {"Patternia", "PatterniaPipe"}
 
+_PLOT_STYLE = "seaborn-v0_8-whitegrid"
+_PLOT_RC = {
+    "font.size": 10.5,
+    "axes.titlesize": 13.5,
+    "axes.labelsize": 11.5,
+    "legend.fontsize": 10.5,
+}
+
+_FOCUS_ROW_FMT = (
+    "| {scenario} | {impl} | {rank} | {mean} | {fastest_impl} | "
+    "{fastest_mean:.3f} | {gap} | {cv} | {status} |\n"
+)
+_DETAIL_ROW_FMT = "| {impl} | {mean:.3f} | {delta} | {vs_pat} | {cv} |\n"
+
+# Bump when _extract_metrics changes shape so stale cache entries are ignored.
+_METRICS_CACHE_VERSION = 3
+
+# Word boundaries used by _label: "VariantMixed" -> "Variant Mixed",
+# "LiteralDense4" -> "Literal Dense 4".
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_DIGIT_BOUNDARY_RE = re.compile(r"(?<=[a-zA-Z])(?=\d)")
+
 
 def _load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iter_entries(path: Path) -> Iterator[dict]:
+    # orjson parses the whole file fastest, so it wins when present. Without
+    # it, ijson pulls the "benchmarks" array one entry at a time so the
+    # whole payload is never resident; otherwise json parses it in one go.
+    if orjson is None and ijson is not None:
+        with path.open("rb") as f:
+            yield from ijson.items(f, "benchmarks.item", use_float=True)
+        return
+    yield from _load_json(path).get("benchmarks", [])
+
+
+def _metrics_cache_path(input_path: Path, outdir: Path) -> Path:
+    # One entry per input: the file's (mtime_ns, size) stamp lives inside
+    # the entry, so a fresh benchmark run overwrites the old one.
+    raw = f"{_METRICS_CACHE_VERSION}:{input_path}"
+    key = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    return outdir / ".cache" / f"{key}.json"
+
+
+def _load_metrics(input_path: Path, outdir: Path, use_cache: bool) -> Dict[str, Dict[str, float]]:
+    # Reruns that only tweak --include/--title reuse the reduced metrics of
+    # an unchanged input instead of parsing the JSON again.
+    if not use_cache:
+        return _extract_metrics(_iter_entries(input_path))
+
+    # Entries are plain JSON ([stamp, metrics]) so loading one never runs
+    # code. The stdlib json module is used on both ends because it
+    # round-trips NaN/Infinity, which orjson would turn into null.
+    st = input_path.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache_path = _metrics_cache_path(input_path, outdir)
+    # Any unreadable, damaged or mismatched entry is just a cache miss.
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if (
+            isinstance(cached, list)
+            and len(cached) == 2
+            and cached[0] == stamp
+            and isinstance(cached[1], dict)
+            and all(
+                isinstance(m, dict) and all(isinstance(v, (int, float)) for v in m.values())
+                for m in cached[1].values()
+            )
+        ):
+            return cached[1]
+    except Exception:
+        pass
+
+    metrics = _extract_metrics(_iter_entries(input_path))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps([stamp, metrics], separators=(",", ":")), encoding="utf-8")
+    except OSError:
+        pass
+    return metrics
 
 
 def _display_path(path: Path) -> str:
@@ -85,19 +183,23 @@ def _base_name_from_entry(entry: dict) -> Optional[str]:
     return name
 
 
-def _extract_metrics(payload: dict) -> Dict[str, Dict[str, float]]:
+def _extract_metrics(entries: Iterable[dict]) -> Dict[str, Dict[str, float]]:
     out: Dict[str, Dict[str, float]] = {}
-    for entry in payload.get("benchmarks", []):
+    for entry in entries:
         base = _base_name_from_entry(entry)
         if base is None:
             continue
 
-        slot = out.setdefault(base, {})
-        agg = entry.get("aggregate_name")
         cpu_time = entry.get("cpu_time")
         if cpu_time is None:
             continue
 
+        # Explicit lookup: setdefault would build a throwaway {} per entry.
+        slot = out.get(base)
+        if slot is None:
+            slot = out[base] = {}
+        agg = entry.get("aggregate_name")
+
         if isinstance(agg, str) and agg:
             slot[agg] = float(cpu_time)
         elif "mean" not in slot:
@@ -108,15 +210,12 @@ def _extract_metrics(payload: dict) -> Dict[str, Dict[str, float]]:
 
 def _split_impl_and_scenario(base_name: str) -> Tuple[str, str]:
     # Strip benchmark parameter suffix: ".../min_time...".
-    core = base_name.split("/", 1)[0]
-
-    if core.startswith("BM_"):
-        core = core[3:]
+    core = base_name.partition("/")[0].removeprefix("BM_")
 
-    parts = core.split("_", 1)
-    if len(parts) == 1:
+    impl, sep, scenario = core.partition("_")
+    if not sep:
         return "Unknown", core
-    return parts[0], parts[1]
+    return impl, scenario
 
 
 def _default_impl_order(impls: Iterable[str]) -> List[str]:
@@ -134,7 +233,9 @@ def _to_points(
     pat = re.compile(include_regex) if include_regex else None
     points: List[BenchPoint] = []
 
-    for base_name, m in sorted(metrics.items()):
+    # Filter, split and build in one pass over the dict, then sort the
+    # (usually much smaller) result in place.
+    for base_name, m in metrics.items():
         if pat and not pat.search(base_name):
             continue
         mean_ns = m.get("mean")
@@ -153,6 +254,7 @@ def _to_points(
                 stddev_ns=m.get("stddev"),
             )
         )
+    points.sort(key=attrgetter("base_name"))
     return points
 
 
@@ -201,15 +303,15 @@ def _points_from_csv(path: Path, include_regex: Optional[str]) -> List[BenchPoin
 
 
 def _to_nested(points: List[BenchPoint]) -> Dict[str, Dict[str, BenchPoint]]:
-    nested: Dict[str, Dict[str, BenchPoint]] = {}
+    nested: DefaultDict[str, Dict[str, BenchPoint]] = defaultdict(dict)
     for p in points:
-        nested.setdefault(p.scenario, {})[p.impl] = p
-    return nested
+        nested[p.scenario][p.impl] = p
+    return dict(nested)
 
 
 def _label(s: str) -> str:
-    s = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", s)
-    s = re.sub(r"(?<=[a-zA-Z])(?=\d)", " ", s)
+    s = _CAMEL_BOUNDARY_RE.sub(" ", s)
+    s = _DIGIT_BOUNDARY_RE.sub(" ", s)
     return s.strip().replace("_", " ")
 
 
@@ -282,12 +384,66 @@ def _fmt_opt(value: Optional[float], fmt: str) -> str:
     return "-" if value is None else format(value, fmt)
 
 
+def _csv_column(values: List[Optional[float]], fmt: str) -> List[str]:
+    # printf-style formatting of a whole column; numpy does the float->str
+    # conversion in one C pass when it is available. None becomes "".
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        return ["" if v is None else fmt % v for v in values]
+
+    arr = np.fromiter(
+        (math.nan if v is None else v for v in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+    formatted = np.char.mod(fmt, arr).tolist()
+    return ["" if v is None else f for f, v in zip(formatted, values)]
+
+
+def _csv_rows(
+    points: List[BenchPoint],
+    summaries: Dict[str, ScenarioSummary],
+) -> Iterator[Tuple[str, ...]]:
+    summary_of = [summaries[p.scenario] for p in points]
+    impl_delta: List[Optional[float]] = [
+        (p.mean_ns / s.fastest_mean_ns - 1.0) * 100.0 if s.fastest_mean_ns > 0 else math.nan
+        for p, s in zip(points, summary_of)
+    ]
+    impl_vs_pat: List[Optional[float]] = [
+        (p.mean_ns / s.patternia_mean_ns - 1.0) * 100.0
+        if s.patternia_mean_ns and s.patternia_mean_ns > 0
+        else None
+        for p, s in zip(points, summary_of)
+    ]
+
+    return zip(
+        [p.base_name for p in points],
+        [p.scenario for p in points],
+        [p.impl for p in points],
+        _csv_column([p.mean_ns for p in points], "%.6f"),
+        _csv_column([p.median_ns for p in points], "%.6f"),
+        _csv_column([p.stddev_ns for p in points], "%.6f"),
+        _csv_column([p.cv_pct for p in points], "%.4f"),
+        ["yes" if p.impl in PATTERNIA_IMPLS else "no" for p in points],
+        [s.fastest_impl for s in summary_of],
+        _csv_column([s.fastest_mean_ns for s in summary_of], "%.6f"),
+        _csv_column(impl_delta, "%.4f"),
+        _csv_column(impl_vs_pat, "%.4f"),
+        [s.patternia_impl or "" for s in summary_of],
+        _csv_column([s.patternia_mean_ns for s in summary_of], "%.6f"),
+        ["" if s.patternia_rank is None else str(s.patternia_rank) for s in summary_of],
+        _csv_column([s.patternia_delta_pct for s in summary_of], "%.4f"),
+        [s.status for s in summary_of],
+    )
+
+
 def _save_csv(
     points: List[BenchPoint],
     summaries: Dict[str, ScenarioSummary],
     path: Path,
 ) -> None:
-    with path.open("w", encoding="utf-8", newline="") as f:
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(
             [
@@ -310,39 +466,7 @@ def _save_csv(
                 "patternia_status",
             ]
         )
-        for p in points:
-            summary = summaries[p.scenario]
-            impl_delta = (
-                (p.mean_ns / summary.fastest_mean_ns - 1.0) * 100.0
-                if summary.fastest_mean_ns > 0
-                else math.nan
-            )
-            impl_vs_pat = (
-                (p.mean_ns / summary.patternia_mean_ns - 1.0) * 100.0
-                if summary.patternia_mean_ns and summary.patternia_mean_ns > 0
-                else None
-            )
-            w.writerow(
-                [
-                    p.base_name,
-                    p.scenario,
-                    p.impl,
-                    f"{p.mean_ns:.6f}",
-                    "" if p.median_ns is None else f"{p.median_ns:.6f}",
-                    "" if p.stddev_ns is None else f"{p.stddev_ns:.6f}",
-                    "" if p.cv_pct is None else f"{p.cv_pct:.4f}",
-                    "yes" if p.impl in PATTERNIA_IMPLS else "no",
-                    summary.fastest_impl,
-                    f"{summary.fastest_mean_ns:.6f}",
-                    f"{impl_delta:.4f}",
-                    "" if impl_vs_pat is None else f"{impl_vs_pat:.4f}",
-                    "" if summary.patternia_impl is None else summary.patternia_impl,
-                    "" if summary.patternia_mean_ns is None else f"{summary.patternia_mean_ns:.6f}",
-                    "" if summary.patternia_rank is None else str(summary.patternia_rank),
-                    "" if summary.patternia_delta_pct is None else f"{summary.patternia_delta_pct:.4f}",
-                    summary.status,
-                ]
-            )
+        w.writerows(_csv_rows(points, summaries))
 
 
 def _save_markdown(
@@ -362,22 +486,24 @@ def _save_markdown(
         default=None,
     )
 
-    lines: List[str] = [
-        "# Patternia Benchmark Report",
-        "",
-        f"- Source: `{_display_path(json_path)}`",
-        f"- Scenarios: `{len(scenarios)}`",
-        f"- Patternia fastest: `{wins}/{len(scenarios)}`",
-        f"- Average Patternia gap vs fastest: `{avg_gap:+.2f}%`",
-        ""
-        if worst is None
-        else f"- Largest Patternia gap: `{worst.scenario}` `{worst.patternia_delta_pct:+.2f}%` vs `{worst.fastest_impl}`",
-        "",
-        "## Patternia Focus",
-        "",
-        "| Scenario | Patternia impl | Rank | Patternia mean (ns) | Fastest | Fastest mean (ns) | Gap vs fastest | Patternia CV % | Status |",
-        "|---|---:|---:|---:|---:|---:|---:|---:|---:|",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("# Patternia Benchmark Report\n\n")
+    w(f"- Source: `{_display_path(json_path)}`\n")
+    w(f"- Scenarios: `{len(scenarios)}`\n")
+    w(f"- Patternia fastest: `{wins}/{len(scenarios)}`\n")
+    w(f"- Average Patternia gap vs fastest: `{avg_gap:+.2f}%`\n")
+    if worst is not None:
+        w(
+            f"- Largest Patternia gap: `{worst.scenario}` "
+            f"`{worst.patternia_delta_pct:+.2f}%` vs `{worst.fastest_impl}`"
+        )
+    w("\n\n## Patternia Focus\n\n")
+    w(
+        "| Scenario | Patternia impl | Rank | Patternia mean (ns) | Fastest | Fastest mean (ns) "
+        "| Gap vs fastest | Patternia CV % | Status |\n"
+    )
+    w("|---|---:|---:|---:|---:|---:|---:|---:|---:|\n")
 
     for scenario in scenarios:
         summary = summaries[scenario]
@@ -391,23 +517,29 @@ def _save_markdown(
             if summary.patternia_delta_pct is None
             else f"{summary.patternia_delta_pct:+.2f}%"
         )
-        lines.append(
-            f"| {scenario} | {summary.patternia_impl or '-'} | {rank} | "
-            f"{_fmt_opt(summary.patternia_mean_ns, '.3f')} | {summary.fastest_impl} | "
-            f"{summary.fastest_mean_ns:.3f} | {gap} | "
-            f"{_fmt_opt(summary.patternia_cv_pct, '.2f')} | {summary.status} |"
+        w(
+            _FOCUS_ROW_FMT.format(
+                scenario=scenario,
+                impl=summary.patternia_impl or "-",
+                rank=rank,
+                mean=_fmt_opt(summary.patternia_mean_ns, ".3f"),
+                fastest_impl=summary.fastest_impl,
+                fastest_mean=summary.fastest_mean_ns,
+                gap=gap,
+                cv=_fmt_opt(summary.patternia_cv_pct, ".2f"),
+                status=summary.status,
+            )
         )
 
-    lines += ["", "---", "", "## Per-Scenario Details"]
+    w("\n---\n\n## Per-Scenario Details\n")
 
     for scenario in scenarios:
         row = dict(sorted(nested[scenario].items(), key=lambda kv: kv[1].mean_ns))
-        fastest = min(row.values(), key=lambda x: x.mean_ns)
+        fastest = row[summaries[scenario].fastest_impl]
         pat_ref = _patternia_best(row)
-        lines.append(f"### {scenario}")
-        lines.append("")
-        lines.append("| Impl | Mean (ns) | vs fastest | vs Patternia | CV % |")
-        lines.append("|---|---:|---:|---:|---:|")
+        w(f"### {scenario}\n\n")
+        w("| Impl | Mean (ns) | vs fastest | vs Patternia | CV % |\n")
+        w("|---|---:|---:|---:|---:|\n")
 
         detail_impls = [impl for impl in row]
         detail_impls += [impl for impl in impl_order if impl in row and impl not in detail_impls]
@@ -425,15 +557,37 @@ def _save_markdown(
                 if pat_ref and pat_ref is not p and pat_ref.mean_ns > 0
                 else "-"
             ) if pat_ref else "-"
-            cv = "-" if p.cv_pct is None else f"{p.cv_pct:.2f}"
-            delta_s = "fastest" if p is fastest else f"{delta:+.2f}%"
-            lines.append(
-                f"| {'**' + impl + '**' if impl in PATTERNIA_IMPLS else impl} | "
-                f"{p.mean_ns:.3f} | {delta_s} | {delta_vs_pat} | {cv} |"
+            w(
+                _DETAIL_ROW_FMT.format(
+                    impl=f"**{impl}**" if impl in PATTERNIA_IMPLS else impl,
+                    mean=p.mean_ns,
+                    delta="fastest" if p is fastest else f"{delta:+.2f}%",
+                    vs_pat=delta_vs_pat,
+                    cv=_fmt_opt(p.cv_pct, ".2f"),
+                )
             )
-        lines.append("")
+        w("\n")
 
-    out_md.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out_md.write_text(buf.getvalue(), encoding="utf-8")
+
+
+def _ratio_grid(means: np.ndarray, fastest: np.ndarray) -> np.ndarray:
+    # numexpr fuses the compare, divide and select into one pass without
+    # temporaries; plain numpy is the fallback when it is not installed.
+    import numpy as np
+
+    try:
+        import numexpr
+    except ImportError:
+        numexpr = None
+
+    if numexpr is not None:
+        return numexpr.evaluate(
+            "where(fastest > 0, means / fastest, nan)",
+            local_dict={"means": means, "fastest": fastest, "nan": np.nan},
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(fastest > 0, means / fastest, np.nan)
 
 
 def _plot(
@@ -443,10 +597,15 @@ def _plot(
     summaries: Dict[str, ScenarioSummary],
     out_png: Path,
     title: str,
+    dpi: int,
 ) -> None:
     try:
+        import matplotlib
+
+        # Select the non-interactive backend before pyplot is imported so no
+        # GUI toolkit is probed; the chart is only ever written to disk.
+        matplotlib.use("Agg", force=True)
         import matplotlib.pyplot as plt
-        from matplotlib.lines import Line2D
     except Exception as exc:  # pragma: no cover
         raise SystemExit(
             "matplotlib is required. Install: py -3 -m pip install matplotlib"
@@ -455,29 +614,42 @@ def _plot(
     if not scenarios:
         raise SystemExit("No implementations to plot.")
 
-    _ = impl_order
-
-    plt.style.use("seaborn-v0_8-whitegrid")
-    plt.rcParams.update(
-        {
-            "font.size": 10.5,
-            "axes.titlesize": 13.5,
-            "axes.labelsize": 11.5,
-            "legend.fontsize": 10.5,
-        }
-    )
+    # Scope the style to this chart instead of mutating the global rcParams.
+    with plt.style.context([_PLOT_STYLE, _PLOT_RC]):
+        _draw_gap_map(nested, scenarios, impl_order, summaries, out_png, title, dpi)
 
-    max_ratio = 1.0
-    for scenario in scenarios:
-        fastest = summaries[scenario].fastest_mean_ns
-        if fastest <= 0:
-            continue
-        max_ratio = max(max_ratio, *(p.mean_ns / fastest for p in nested[scenario].values()))
 
-    x_max = max(1.35, max_ratio * 1.14)
+def _draw_gap_map(
+    nested: Dict[str, Dict[str, BenchPoint]],
+    scenarios: List[str],
+    impl_order: List[str],
+    summaries: Dict[str, ScenarioSummary],
+    out_png: Path,
+    title: str,
+    dpi: int,
+) -> None:
+    # _plot has already selected the Agg backend.
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.lines import Line2D
+
+    # Dense (scenario x impl) grid of means; missing pairs stay NaN. Ratios to
+    # each row's fastest implementation are then one broadcast division.
+    impl_col = {impl: j for j, impl in enumerate(impl_order)}
+    means = np.full((len(scenarios), len(impl_order)), np.nan)
+    for yi, scenario in enumerate(scenarios):
+        for impl, p in nested[scenario].items():
+            means[yi, impl_col[impl]] = p.mean_ns
+    # The per-scenario fastest mean is already known from _summaries.
+    fastest = np.array([summaries[s].fastest_mean_ns for s in scenarios])[:, None]
+    ratios = _ratio_grid(means, fastest)
+    row_max = np.nanmax(ratios, axis=1, initial=1.0)
+    is_competitor = np.array([impl not in PATTERNIA_IMPLS for impl in impl_order], dtype=bool)
+
+    x_max = max(1.35, float(row_max.max()) * 1.14)
     n = len(scenarios)
     fig_h = max(6.0, n * 0.72 + 3.2)
-    fig, ax = plt.subplots(figsize=(14.2, fig_h), dpi=220)
+    fig, ax = plt.subplots(figsize=(14.2, fig_h), dpi=dpi)
     fig.patch.set_facecolor("#f4f1ea")
     ax.set_facecolor("#fffdf8")
     # Dynamically size the axes area to the figure height.
@@ -502,36 +674,36 @@ def _plot(
     competitor_color = "#9aa3b2"
     line_color = "#cbd5e1"
 
-    for yi, scenario in enumerate(scenarios):
-        row = sorted(nested[scenario].values(), key=lambda p: p.mean_ns)
-        summary = summaries[scenario]
-        fastest = summary.fastest_mean_ns
-        ratios = [p.mean_ns / fastest for p in row] if fastest > 0 else [1.0]
-        row_max = max(ratios)
+    ys = np.arange(n)
+    ax.hlines(ys, 1.0, row_max, color=line_color, linewidth=6.0, alpha=0.92, zorder=1)
+    ax.scatter(
+        np.ones(n),
+        ys,
+        marker="|",
+        s=260,
+        color="#111827",
+        linewidth=2.1,
+        zorder=4,
+    )
 
-        ax.hlines(yi, 1.0, row_max, color=line_color, linewidth=6.0, alpha=0.92, zorder=1)
-        for p, ratio in zip(row, ratios):
-            if p.impl in PATTERNIA_IMPLS:
-                continue
-            ax.scatter(
-                ratio,
-                yi,
-                s=42,
-                color=competitor_color,
-                edgecolor="#ffffff",
-                linewidth=0.8,
-                zorder=3,
-            )
+    # One collection per marker kind instead of one scatter call per point.
+    competitor_ratios = ratios[:, is_competitor]
+    present = ~np.isnan(competitor_ratios)
+    ax.scatter(
+        competitor_ratios[present],
+        np.nonzero(present)[0],
+        s=42,
+        color=competitor_color,
+        edgecolor="#ffffff",
+        linewidth=0.8,
+        zorder=3,
+    )
 
-        ax.scatter(
-            1.0,
-            yi,
-            marker="|",
-            s=260,
-            color="#111827",
-            linewidth=2.1,
-            zorder=4,
-        )
+    pat_xs: List[float] = []
+    pat_ys: List[int] = []
+    pat_colors: List[str] = []
+    for yi, scenario in enumerate(scenarios):
+        summary = summaries[scenario]
         ax.text(
             1.006,
             yi + 0.20,
@@ -554,16 +726,9 @@ def _plot(
             continue
 
         pat_color = status_colors[summary.status]
-        ax.scatter(
-            summary.patternia_ratio,
-            yi,
-            marker="D",
-            s=112,
-            color=pat_color,
-            edgecolor="#0f172a",
-            linewidth=0.7,
-            zorder=5,
-        )
+        pat_xs.append(summary.patternia_ratio)
+        pat_ys.append(yi)
+        pat_colors.append(pat_color)
         gap = summary.patternia_delta_pct or 0.0
         ax.annotate(
             f"{summary.patternia_impl} {summary.patternia_ratio:.2f}x ({gap:+.1f}%)",
@@ -584,6 +749,18 @@ def _plot(
             zorder=6,
         )
 
+    if pat_xs:
+        ax.scatter(
+            pat_xs,
+            pat_ys,
+            marker="D",
+            s=112,
+            color=pat_colors,
+            edgecolor="#0f172a",
+            linewidth=0.7,
+            zorder=5,
+        )
+
     labels = [_label(s) for s in scenarios]
     label_size = 11.5 if len(scenarios) <= 6 else 10.0
     ax.set_yticks(list(range(len(scenarios))))
@@ -683,11 +860,17 @@ def main() -> None:
     parser.add_argument("--outdir", default=str(DEFAULT_OUTDIR), help="Output directory")
     parser.add_argument("--prefix", default="bench_single", help="Output file prefix")
     parser.add_argument("--title", default="Benchmark Single Report", help="Chart title")
+    parser.add_argument("--dpi", type=int, default=140, help="PNG resolution (default: 140)")
     parser.add_argument(
         "--no-plot",
         action="store_true",
         help="Skip PNG generation and only write markdown/csv.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the input JSON instead of reusing <outdir>/.cache.",
+    )
     args = parser.parse_args()
 
     input_path = Path(args.input).resolve()
@@ -698,8 +881,7 @@ def main() -> None:
     if input_path.suffix.lower() == ".csv":
         points = _points_from_csv(input_path, include_regex)
     else:
-        payload = _load_json(input_path)
-        metrics = _extract_metrics(payload)
+        metrics = _load_metrics(input_path, outdir, not args.no_cache)
         points = _to_points(metrics, include_regex)
     if not points:
         raise SystemExit("No benchmark entries found after filtering.")
@@ -717,7 +899,7 @@ def main() -> None:
     _save_markdown(nested, scenarios, impl_order, summaries, input_path, out_md)
     _save_csv(points, summaries, out_csv)
     if not args.no_plot:
-        _plot(nested, scenarios, impl_order, summaries, out_png, args.title)
+        _plot(nested, scenarios, impl_order, summaries, out_png, args.title, args.dpi)
 
     print(f"Saved markdown: {out_md}")
     print(f"Saved csv: {out_csv}")
@@ -12,7 +12,9 @@ After staging, run:
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
+import stat
 from pathlib import Path
 
 
@@ -21,17 +23,56 @@ DEFAULT_DEST = REPO_ROOT / "bench" / "results"
 
 
 def _resolve_result_path(raw: str) -> Path:
-    p = Path(raw).expanduser().resolve()
-    if p.is_dir():
-        p = p / "result.json"
-    return p
+    # One realpath plus a single stat, instead of Path.resolve() followed by
+    # a separate is_dir() probe.
+    p = os.path.realpath(os.path.expanduser(raw))
+    try:
+        is_dir = stat.S_ISDIR(os.stat(p).st_mode)
+    except OSError:
+        is_dir = False
+    return Path(p, "result.json") if is_dir else Path(p)
+
+
+def _same_file(src: Path, dst: Path) -> bool:
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    # copy_file_range lets the kernel move (or reflink) the data without a
+    # user-space buffer. It is Linux-only and may refuse some filesystem
+    # pairs or stop short, in which case shutil.copyfile (sendfile / chunked
+    # copy) redoes the whole copy. copystat keeps the copy2 metadata
+    # semantics.
+    if _same_file(src, dst):
+        # Check before opening dst for writing, which would truncate src.
+        raise shutil.SameFileError(f"{src!s} and {dst!s} are the same file")
+    copy_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_range is not None:
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            copied = remaining == 0
+        except OSError:
+            pass
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 def _copy(src: Path, dst: Path) -> None:
     if not src.exists():
         raise SystemExit(f"source not found: {src}")
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    _fast_copy(src, dst)
 
 
 def main() -> int:
@@ -44,7 +85,7 @@ def main() -> int:
     baseline_src = _resolve_result_path(args.baseline)
     current_src = _resolve_result_path(args.current)
 
-    dest_root = Path(args.dest).expanduser().resolve()
+    dest_root = Path(os.path.realpath(os.path.expanduser(args.dest)))
     baseline_dst = dest_root / "baseline" / "result.json"
     current_dst = dest_root / "current" / "result.json"
 